@@ -1,8 +1,6 @@
 """
 Binance Futures Trading Bot
 """
-from .client import BinanceFuturesClient
-from .orders import OrderManager
 from .validators import InputValidator
 from .logging_config import setup_logging
 
@@ -12,3 +10,15 @@ __all__ = [
     'InputValidator',
     'setup_logging'
 ]
+
+
+def __getattr__(name):
+    # The client and order modules pull in the HTTP stack, so they are only
+    # imported on first use (PEP 562)
+    if name == 'BinanceFuturesClient':
+        from .client import BinanceFuturesClient
+        return BinanceFuturesClient
+    if name == 'OrderManager':
+        from .orders import OrderManager
+        return OrderManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,84 @@
+"""
+On-disk TTL cache for rarely changing API responses
+"""
+import hashlib
+import logging
+import os
+import time
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+    import json
+
+logger = logging.getLogger(__name__)
+
+
+class FileCache:
+    """Stores JSON-serialisable values as files, one per key"""
+    
+    def __init__(self, cache_dir: str = os.path.join('logs', '.cache')):
+        """
+        Initialize FileCache
+        
+        Args:
+            cache_dir: Directory to store cache files
+        """
+        self.cache_dir = cache_dir
+    
+    def _path(self, key: str) -> str:
+        """Return the cache file path for a key"""
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f'{digest}.json')
+    
+    def get(self, key: str, ttl: float) -> Optional[Any]:
+        """
+        Get a cached value
+        
+        Args:
+            key: Cache key
+            ttl: Maximum age of the entry in seconds
+        
+        Returns:
+            Cached value, or None if missing, expired or unreadable
+        """
+        try:
+            with open(self._path(key), 'rb') as f:
+                raw = f.read()
+            entry = orjson.loads(raw) if orjson else json.loads(raw)
+        except (OSError, ValueError):
+            return None
+        
+        if not isinstance(entry, dict) or not isinstance(entry.get('ts'), (int, float)):
+            logger.debug(f"Ignoring malformed cache entry: {key}")
+            return None
+        
+        if time.time() - entry['ts'] > ttl:
+            logger.debug(f"Cache expired: {key}")
+            return None
+        
+        logger.debug(f"Cache hit: {key}")
+        return entry.get('data')
+    
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value in the cache
+        
+        Args:
+            key: Cache key
+            value: JSON-serialisable value
+        """
+        entry = {'ts': time.time(), 'data': value}
+        raw = orjson.dumps(entry) if orjson else json.dumps(entry).encode('utf-8')
+        path = self._path(key)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(raw)
+            # Atomic rename so concurrent readers never see a partial file
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write cache entry {key}: {e}")
@@ -5,49 +5,181 @@ Handles authentication and API communication
 import hashlib
 import hmac
 import time
+from urllib.parse import urlencode
 import requests
-from typing import Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, List, Optional, Union
 import logging
+import os
+
+from .cache import FileCache
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:  # pragma: no cover - optional dependency
+    import json
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(',', ':'))
+
+try:
+    import h2  # noqa: F401 - required by httpx for HTTP/2
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+try:
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.hmac import HMAC as CryptoHMAC
+except ImportError:  # pragma: no cover - optional dependency
+    CryptoHMAC = None
 
 logger = logging.getLogger(__name__)
 
+# Exchange info changes rarely, so cached copies are reused for a day
+EXCHANGE_INFO_TTL = 24 * 60 * 60
+
+# Milliseconds a signed request stays valid after its timestamp
+RECV_WINDOW = 5000
+
+# Seconds to wait for the API before giving up on a request
+REQUEST_TIMEOUT = 5.0
+
+# Retries for failed connections (and, with requests, 429/5xx responses)
+MAX_RETRIES = 3
+
+# Maximum number of orders accepted by /fapi/v1/batchOrders
+MAX_BATCH_ORDERS = 5
+
+# hashlib serves SHA-256 from OpenSSL (SHA-NI accelerated where the CPU allows)
+# unless the interpreter was built without it
+OPENSSL_SHA256 = getattr(hashlib.sha256, '__name__', '') == 'openssl_sha256'
+
+# Exceptions raised by either HTTP backend for network failures
+NETWORK_ERRORS = (requests.exceptions.RequestException,)
+if httpx is not None:
+    NETWORK_ERRORS += (httpx.HTTPError,)
+
+HttpSession = Union[requests.Session, 'httpx.Client']
+
+# Sessions shared process-wide, keyed by API key, so that ping, account and
+# order calls reuse the same pooled keep-alive connections
+_sessions: Dict[str, HttpSession] = {}
+
+
+class BinanceAPIError(ValueError):
+    """Error response returned by the Binance API"""
+    
+    def __init__(self, message: str, status_code: int):
+        """
+        Initialize BinanceAPIError
+        
+        Args:
+            message: Error message
+            status_code: HTTP status code of the response
+        """
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def _get_session(api_key: str) -> HttpSession:
+    """
+    Get (or create) the shared HTTP session for an API key
+    
+    Uses an HTTP/2 httpx client when httpx and h2 are installed, so that
+    concurrent calls are multiplexed over one connection. Otherwise falls
+    back to a pooled requests session. Both retry failed connections up to
+    MAX_RETRIES times; only the requests session also retries 429/5xx
+    responses, since httpx transports do not retry on status codes.
+    
+    Args:
+        api_key: Binance API key
+        
+    Returns:
+        Session with a tuned connection pool
+    """
+    session = _sessions.get(api_key)
+    if session is None and httpx is not None:
+        transport = httpx.HTTPTransport(
+            http2=True,
+            retries=MAX_RETRIES,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+        )
+        session = httpx.Client(
+            transport=transport,
+            headers={'X-MBX-APIKEY': api_key}
+        )
+        _sessions[api_key] = session
+    elif session is None:
+        session = requests.Session()
+        # Only idempotent methods are retried by default, so orders are never resent.
+        # The last response is returned once retries run out so that _request
+        # can report the API error instead of a RetryError
+        retries = Retry(
+            total=MAX_RETRIES,
+            backoff_factor=0.1,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=32, max_retries=retries)
+        session.mount('https://', adapter)
+        session.headers.update({
+            'X-MBX-APIKEY': api_key,
+            'Connection': 'keep-alive'
+        })
+        _sessions[api_key] = session
+    return session
+
 
 class BinanceFuturesClient:
     """Client for interacting with Binance Futures Testnet API"""
     
-    def __init__(self, api_key: str, api_secret: str):
+    def __init__(self, api_key: str, api_secret: str,
+                 cache_dir: str = os.path.join('logs', '.cache')):
         """
         Initialize the Binance Futures client
         
         Args:
             api_key: Binance API key
             api_secret: Binance API secret
+            cache_dir: Directory for cached exchange info
         """
         self.api_key = api_key
         self.api_secret = api_secret
         self.base_url = "https://testnet.binancefuture.com"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'X-MBX-APIKEY': self.api_key
-        })
+        self.session = _get_session(self.api_key)
+        self.cache = FileCache(cache_dir)
+        # Keyed HMAC state is primed once and cloned for every signature
+        self._secret_bytes = api_secret.encode('utf-8')
+        if OPENSSL_SHA256 or CryptoHMAC is None:
+            if not OPENSSL_SHA256:
+                logger.warning("hashlib SHA-256 is not OpenSSL-backed; signing will be slow")
+            self._hmac_template = hmac.new(self._secret_bytes, b'', hashlib.sha256)
+        else:
+            logger.warning("hashlib SHA-256 is not OpenSSL-backed; signing with cryptography")
+            self._hmac_template = CryptoHMAC(self._secret_bytes, hashes.SHA256())
         
-    def _generate_signature(self, params: Dict[str, Any]) -> str:
+    def _generate_signature(self, query_string: str) -> str:
         """
         Generate HMAC SHA256 signature for authenticated requests
         
         Args:
-            params: Request parameters
+            query_string: URL-encoded request parameters
             
         Returns:
             Hex signature string
         """
-        query_string = '&'.join([f"{key}={value}" for key, value in params.items()])
-        signature = hmac.new(
-            self.api_secret.encode('utf-8'),
-            query_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-        return signature
+        signer = self._hmac_template.copy()
+        signer.update(query_string.encode('ascii'))
+        if isinstance(signer, hmac.HMAC):
+            return signer.hexdigest()
+        return signer.finalize().hex()
     
     def _request(self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None, 
                  signed: bool = False) -> Dict[str, Any]:
@@ -65,41 +197,53 @@ class BinanceFuturesClient:
             
         Raises:
             requests.exceptions.RequestException: On network errors
-            ValueError: On API errors
+            httpx.HTTPError: On network errors (httpx backend)
+            BinanceAPIError: On API errors (a ValueError subclass)
+            ValueError: If a successful response is not valid JSON
         """
         url = f"{self.base_url}{endpoint}"
         params = params or {}
         
         if signed:
-            params['timestamp'] = int(time.time() * 1000)
-            params['signature'] = self._generate_signature(params)
+            params['timestamp'] = time.time_ns() // 1_000_000
+            params['recvWindow'] = RECV_WINDOW
+            # Send exactly the query string that was signed, since HTTP
+            # backends may percent-encode values (e.g. JSON) differently
+            query_string = urlencode(params)
+            signature = self._generate_signature(query_string)
+            url = f"{url}?{query_string}&signature={signature}"
         
         logger.info(f"Making {method} request to {endpoint}")
-        logger.debug(f"Request params: {params}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Request params: {params}")
         
         try:
-            response = self.session.request(method, url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            logger.info(f"Request successful: {response.status_code}")
-            logger.debug(f"Response data: {data}")
-            
-            return data
-            
-        except requests.exceptions.HTTPError as e:
-            error_msg = f"HTTP Error: {e.response.status_code}"
-            try:
-                error_data = e.response.json()
-                error_msg += f" - {error_data.get('msg', 'Unknown error')}"
-                logger.error(f"API Error: {error_data}")
-            except:
-                logger.error(f"HTTP Error: {e}")
-            raise ValueError(error_msg)
-            
-        except requests.exceptions.RequestException as e:
+            response = self.session.request(method, url, params=None if signed else params,
+                                            timeout=REQUEST_TIMEOUT)
+        except NETWORK_ERRORS as e:
             logger.error(f"Network Error: {e}")
             raise
+        
+        status_code = response.status_code
+        if 200 <= status_code < 300:
+            try:
+                data = _json_loads(response.content)
+            except ValueError as e:
+                logger.error(f"Invalid JSON in {status_code} response from {endpoint}: {e}")
+                raise ValueError(f"Invalid JSON in response from {endpoint}")
+            logger.info(f"Request successful: {status_code}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Response data: {data}")
+            return data
+        
+        error_msg = f"HTTP Error: {status_code}"
+        try:
+            error_data = _json_loads(response.content)
+            error_msg += f" - {error_data.get('msg', 'Unknown error')}"
+            logger.error(f"API Error: {error_data}")
+        except (ValueError, AttributeError):
+            logger.error(f"HTTP Error: {status_code} for {method} {endpoint}")
+        raise BinanceAPIError(error_msg, status_code)
     
     def test_connectivity(self) -> bool:
         """
@@ -129,16 +273,26 @@ class BinanceFuturesClient:
         """
         Get exchange trading rules and symbol information
         
+        Responses are cached on disk for EXCHANGE_INFO_TTL seconds.
+        
         Args:
             symbol: Optional specific symbol to query
             
         Returns:
             Exchange information dictionary
         """
+        cache_key = f"exchangeInfo:{symbol or 'ALL'}"
+        cached = self.cache.get(cache_key, EXCHANGE_INFO_TTL)
+        if cached is not None:
+            logger.info("Using cached exchange info")
+            return cached
+        
         params = {}
         if symbol:
             params['symbol'] = symbol
-        return self._request('GET', '/fapi/v1/exchangeInfo', params=params)
+        data = self._request('GET', '/fapi/v1/exchangeInfo', params=params)
+        self.cache.set(cache_key, data)
+        return data
     
     def place_order(self, symbol: str, side: str, order_type: str, 
                     quantity: float, price: Optional[float] = None,
@@ -176,3 +330,30 @@ class BinanceFuturesClient:
         logger.info(f"Placing {order_type} {side} order for {quantity} {symbol}")
         
         return self._request('POST', '/fapi/v1/order', params=params, signed=True)
+    
+    def place_batch_orders(self, orders: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Place several orders in a single signed request
+        
+        Args:
+            orders: Order parameters using API field names (symbol, side,
+                type, quantity, price, timeInForce), at most MAX_BATCH_ORDERS
+            
+        Returns:
+            List of per-order responses; rejected orders contain 'code' and 'msg'
+            
+        Raises:
+            ValueError: If the batch is empty or too large
+        """
+        if not orders:
+            raise ValueError("At least one order is required")
+        if len(orders) > MAX_BATCH_ORDERS:
+            raise ValueError(f"At most {MAX_BATCH_ORDERS} orders can be placed per batch")
+        
+        # The endpoint expects every order field as a string
+        batch = [{key: str(value) for key, value in order.items()} for order in orders]
+        params = {'batchOrders': _json_dumps(batch)}
+        
+        logger.info(f"Placing batch of {len(orders)} orders")
+        
+        return self._request('POST', '/fapi/v1/batchOrders', params=params, signed=True)
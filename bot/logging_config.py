@@ -1,9 +1,18 @@
 """
 Logging configuration for the trading bot
 """
+import atexit
 import logging
 import os
+import queue
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+
+# Background listener draining queued records to the file handler; console
+# output is written synchronously
+_listener = None
+_queue_handler = None
+_console_handler = None
 
 
 def setup_logging(log_dir: str = 'logs', log_level: int = logging.INFO) -> None:
@@ -15,8 +24,7 @@ def setup_logging(log_dir: str = 'logs', log_level: int = logging.INFO) -> None:
         log_level: Logging level (default: INFO)
     """
     # Create logs directory if it doesn't exist
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+    os.makedirs(log_dir, exist_ok=True)
     
     # Generate log filename with timestamp
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -40,10 +48,30 @@ def setup_logging(log_dir: str = 'logs', log_level: int = logging.INFO) -> None:
     console_formatter = logging.Formatter('%(levelname)s - %(message)s')
     console_handler.setFormatter(console_formatter)
     
-    # Configure root logger
+    # Skip caller/thread/process lookups that the formats above never use
+    logging._srcfile = None
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    
+    # Route file records through a queue so disk I/O happens on a background
+    # thread instead of the request path. The console handler stays
+    # synchronous so its output keeps its place among the CLI's prints.
+    global _listener, _queue_handler, _console_handler
     root_logger = logging.getLogger()
+    stop_logging()
+    for handler in (_queue_handler, _console_handler):
+        if handler is not None:
+            root_logger.removeHandler(handler)
+    log_queue = queue.Queue(-1)
+    _queue_handler = QueueHandler(log_queue)
+    _console_handler = console_handler
+    _listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _listener.start()
+    
+    # Configure root logger
     root_logger.setLevel(log_level)
-    root_logger.addHandler(file_handler)
+    root_logger.addHandler(_queue_handler)
     root_logger.addHandler(console_handler)
     
     # Log startup message
@@ -53,3 +81,19 @@ def setup_logging(log_dir: str = 'logs', log_level: int = logging.INFO) -> None:
     logging.info("="*60)
     
     return log_file
+
+
+def stop_logging() -> None:
+    """
+    Flush queued log records, stop the background listener and close its
+    handlers
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(stop_logging)
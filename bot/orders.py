@@ -1,12 +1,33 @@
 """
 Order placement and management logic
 """
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import logging
-from .client import BinanceFuturesClient
+from .client import BinanceFuturesClient, BinanceAPIError, MAX_BATCH_ORDERS
 
 logger = logging.getLogger(__name__)
 
+_BORDER = "=" * 60
+
+# (label, response key) pairs shown by format_order_response
+_FIELDS = (
+    ('Order ID', 'orderId'),
+    ('Symbol', 'symbol'),
+    ('Side', 'side'),
+    ('Type', 'type'),
+    ('Status', 'status'),
+    ('Quantity', 'origQty'),
+    ('Executed Quantity', 'executedQty'),
+    ('Price', 'price'),
+    ('Average Price', 'avgPrice'),
+    ('Time in Force', 'timeInForce'),
+    ('Update Time', 'updateTime'),
+)
+
+# Field values treated as missing and left out of the formatted response
+# (0.0 and False compare equal to 0, matching the previous != checks)
+_SENTINELS = frozenset({'N/A', '0', 0})
+
 
 class OrderManager:
     """Manages order placement and validation"""
@@ -79,6 +100,69 @@ class OrderManager:
             logger.error(f"Failed to place limit order: {e}")
             raise
     
+    def place_batch_orders(self, orders: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Place several orders using as few requests as possible
+        
+        Orders are sent in chunks of MAX_BATCH_ORDERS via the batch endpoint.
+        If a chunk request fails, no further chunks are sent and responses of
+        orders already placed are still returned. Orders of the failed chunk
+        are only reported as rejected when the API returned a client error;
+        after a network error, timeout or server error they may have been
+        partly executed and are marked with status 'UNKNOWN'.
+        
+        Args:
+            orders: Validated orders as returned by InputValidator.validate_all
+            
+        Returns:
+            One response per order in input order; rejected, unsent and
+            unknown orders contain 'code' and 'msg' instead of an order ID
+        """
+        logger.info(f"Placing {len(orders)} orders in batches of {MAX_BATCH_ORDERS}")
+        
+        batch_params = []
+        for order in orders:
+            params = {
+                'symbol': order['symbol'],
+                'side': order['side'],
+                'type': order['order_type'],
+                'quantity': order['quantity'],
+            }
+            if order['order_type'] == 'LIMIT':
+                params['price'] = order['price']
+                params['timeInForce'] = 'GTC'
+            batch_params.append(params)
+        
+        responses = []
+        for start in range(0, len(batch_params), MAX_BATCH_ORDERS):
+            chunk = batch_params[start:start + MAX_BATCH_ORDERS]
+            try:
+                chunk_responses = self.client.place_batch_orders(chunk)
+            except Exception as e:
+                # Earlier chunks are already live on the exchange, so keep their
+                # responses. This chunk only definitely failed if the API
+                # rejected it; otherwise the exchange may have accepted it
+                logger.error(f"Failed to place batch orders after {len(responses)} responses: {e}")
+                if isinstance(e, BinanceAPIError) and e.status_code < 500:
+                    failed = {'code': None, 'msg': f"Batch request rejected: {e}"}
+                else:
+                    failed = {'code': None, 'status': 'UNKNOWN',
+                              'msg': f"Batch request failed, order may have been placed: {e}"}
+                responses.extend(dict(failed) for _ in chunk)
+                
+                unsent = {'code': None, 'msg': "Not sent after an earlier batch request failed"}
+                responses.extend(dict(unsent) for _ in batch_params[start + len(chunk):])
+                break
+            
+            for response in chunk_responses:
+                if 'orderId' in response:
+                    logger.info(f"Batch order placed successfully: Order ID {response['orderId']}")
+                else:
+                    logger.error(f"Batch order rejected: {response.get('msg', response)}")
+                responses.append(response)
+        
+        return responses
+    
     def format_order_response(self, response: Dict[str, Any]) -> str:
         """
         Format order response for display
@@ -89,28 +173,12 @@ class OrderManager:
         Returns:
             Formatted string
         """
-        output = "\n" + "="*60 + "\n"
-        output += "ORDER RESPONSE\n"
-        output += "="*60 + "\n"
-        
-        fields = [
-            ('Order ID', 'orderId'),
-            ('Symbol', 'symbol'),
-            ('Side', 'side'),
-            ('Type', 'type'),
-            ('Status', 'status'),
-            ('Quantity', 'origQty'),
-            ('Executed Quantity', 'executedQty'),
-            ('Price', 'price'),
-            ('Average Price', 'avgPrice'),
-            ('Time in Force', 'timeInForce'),
-            ('Update Time', 'updateTime'),
-        ]
-        
-        for label, key in fields:
+        parts = ["", _BORDER, "ORDER RESPONSE", _BORDER]
+        for label, key in _FIELDS:
             value = response.get(key, 'N/A')
-            if value != 'N/A' and value != '0' and value != 0:
-                output += f"{label:20}: {value}\n"
-        
-        output += "="*60 + "\n"
-        return output
+            # Only scalars are looked up, so list/dict values cannot raise TypeError
+            if isinstance(value, (str, int, float)) and value in _SENTINELS:
+                continue
+            parts.append(f"{label:20}: {value}")
+        parts.append(_BORDER)
+        return "\n".join(parts) + "\n"
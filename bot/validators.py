@@ -2,11 +2,18 @@
 Input validation for trading parameters
 """
 import logging
+import math
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
 
+def _normalize_symbol(symbol: str) -> Optional[str]:
+    """Return the stripped, uppercase symbol, or None if it is too short"""
+    symbol = symbol.strip().upper()
+    return symbol if len(symbol) >= 3 else None
+
+
 class InputValidator:
     """Validates trading input parameters"""
     
@@ -30,12 +37,14 @@ class InputValidator:
         if not symbol or not isinstance(symbol, str):
             raise ValueError("Symbol must be a non-empty string")
         
-        symbol = symbol.upper().strip()
+        normalized = _normalize_symbol(symbol)
         
-        if len(symbol) < 3:
+        if normalized is None:
             raise ValueError("Symbol is too short")
+        symbol = normalized
         
-        logger.debug(f"Symbol validated: {symbol}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Symbol validated: {symbol}")
         return symbol
     
     @staticmethod
@@ -60,7 +69,8 @@ class InputValidator:
         if side not in InputValidator.VALID_SIDES:
             raise ValueError(f"Side must be one of {InputValidator.VALID_SIDES}")
         
-        logger.debug(f"Side validated: {side}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Side validated: {side}")
         return side
     
     @staticmethod
@@ -85,7 +95,8 @@ class InputValidator:
         if order_type not in InputValidator.VALID_ORDER_TYPES:
             raise ValueError(f"Order type must be one of {InputValidator.VALID_ORDER_TYPES}")
         
-        logger.debug(f"Order type validated: {order_type}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Order type validated: {order_type}")
         return order_type
     
     @staticmethod
@@ -107,10 +118,14 @@ class InputValidator:
         except (TypeError, ValueError):
             raise ValueError("Quantity must be a valid number")
         
+        if not math.isfinite(quantity):
+            raise ValueError("Quantity must be a finite number")
+        
         if quantity <= 0:
             raise ValueError("Quantity must be greater than 0")
         
-        logger.debug(f"Quantity validated: {quantity}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Quantity validated: {quantity}")
         return quantity
     
     @staticmethod
@@ -139,10 +154,14 @@ class InputValidator:
         except (TypeError, ValueError):
             raise ValueError("Price must be a valid number")
         
+        if not math.isfinite(price):
+            raise ValueError("Price must be a finite number")
+        
         if price <= 0:
             raise ValueError("Price must be greater than 0")
         
-        logger.debug(f"Price validated: {price}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Price validated: {price}")
         return price
     
     @classmethod
@@ -164,10 +183,16 @@ class InputValidator:
         Raises:
             ValueError: If any parameter is invalid
         """
+        # Values already in canonical form (e.g. normalised by the CLI) skip re-checking
+        if side not in cls.VALID_SIDES:
+            side = cls.validate_side(side)
+        if order_type not in cls.VALID_ORDER_TYPES:
+            order_type = cls.validate_order_type(order_type)
+        
         validated = {
             'symbol': cls.validate_symbol(symbol),
-            'side': cls.validate_side(side),
-            'order_type': cls.validate_order_type(order_type),
+            'side': side,
+            'order_type': order_type,
             'quantity': cls.validate_quantity(quantity),
             'price': cls.validate_price(price, order_type)
         }
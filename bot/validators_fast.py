@@ -0,0 +1,105 @@
+"""
+Vectorised validation for large batches of orders
+"""
+import logging
+from typing import Optional, Sequence
+
+import numpy as np
+
+from .validators import InputValidator, _normalize_symbol
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None
+
+logger = logging.getLogger(__name__)
+
+
+def _validate_qty_price_numpy(quantities: np.ndarray, prices: np.ndarray,
+                              is_limit: np.ndarray) -> np.ndarray:
+    """
+    Check quantities and prices with NumPy array operations
+    
+    Args:
+        quantities: Order quantities
+        prices: Order prices (ignored where is_limit is False)
+        is_limit: Whether each order is a LIMIT order
+    
+    Returns:
+        Boolean mask of rows with a valid quantity and price
+    """
+    qty_ok = np.isfinite(quantities) & (quantities > 0)
+    price_ok = ~is_limit | (np.isfinite(prices) & (prices > 0))
+    return qty_ok & price_ok
+
+
+if njit is not None:
+    @njit(cache=True, parallel=True)
+    def _validate_qty_price(quantities, prices, is_limit):
+        """Numba kernel equivalent of _validate_qty_price_numpy"""
+        n = quantities.shape[0]
+        valid = np.empty(n, dtype=np.bool_)
+        for i in prange(n):
+            qty = quantities[i]
+            price = prices[i]
+            qty_ok = np.isfinite(qty) and qty > 0
+            price_ok = not is_limit[i] or (np.isfinite(price) and price > 0)
+            valid[i] = qty_ok and price_ok
+        return valid
+else:
+    _validate_qty_price = _validate_qty_price_numpy
+
+
+def validate_all_batch(symbols: Sequence[str], sides: Sequence[str],
+                       order_types: Sequence[str], quantities: Sequence[float],
+                       prices: Sequence[Optional[float]]) -> np.ndarray:
+    """
+    Validate many orders at once
+    
+    Applies the same rules as InputValidator.validate_all, but reports
+    invalid rows in a mask instead of raising. The quantity and price
+    checks are compiled with Numba when it is installed.
+    
+    Args:
+        symbols: Trading pair symbols
+        sides: Order sides
+        order_types: Order types
+        quantities: Order quantities
+        prices: Order prices (None for MARKET orders)
+    
+    Returns:
+        Boolean array, True where the order is valid
+    
+    Raises:
+        ValueError: If the input sequences differ in length or a quantity
+            or price is not numeric
+    """
+    n = len(symbols)
+    if not (len(sides) == len(order_types) == len(quantities) == len(prices) == n):
+        raise ValueError("All batch inputs must have the same length")
+    
+    valid_sides = set(InputValidator.VALID_SIDES)
+    valid_types = set(InputValidator.VALID_ORDER_TYPES)
+    
+    text_ok = np.fromiter(
+        (
+            isinstance(symbol, str) and _normalize_symbol(symbol) is not None
+            and isinstance(side, str) and side.upper().strip() in valid_sides
+            and isinstance(order_type, str) and order_type.upper().strip() in valid_types
+            for symbol, side, order_type in zip(symbols, sides, order_types)
+        ),
+        dtype=np.bool_,
+        count=n
+    )
+    is_limit = np.fromiter(
+        (isinstance(t, str) and t.upper().strip() == 'LIMIT' for t in order_types),
+        dtype=np.bool_,
+        count=n
+    )
+    qty_arr = np.asarray(quantities, dtype=np.float64)
+    price_arr = np.array([np.nan if p is None else p for p in prices], dtype=np.float64)
+    
+    valid = text_ok & _validate_qty_price(qty_arr, price_arr, is_limit)
+    logger.info(f"Batch validated: {int(valid.sum())}/{n} orders valid")
+    return valid
@@ -3,25 +3,29 @@
 CLI interface for Binance Futures Trading Bot
 """
 import argparse
+import json
 import sys
 import os
 import logging
-from typing import Optional
+from typing import List, Optional
 
-from bot import BinanceFuturesClient, OrderManager, InputValidator, setup_logging
+from bot import InputValidator, setup_logging
 
 logger = logging.getLogger(__name__)
 
 
-def print_banner():
-    """Print application banner"""
-    banner = """
+_BANNER = """
     ╔════════════════════════════════════════════════════════════╗
     ║      Binance Futures Trading Bot - Testnet                 ║
     ║      Python Developer Application Task                     ║
     ╚════════════════════════════════════════════════════════════╝
-    """
-    print(banner)
+    
+"""
+
+
+def print_banner():
+    """Print application banner"""
+    sys.stdout.write(_BANNER)
 
 
 def print_order_summary(symbol: str, side: str, order_type: str, 
@@ -61,8 +65,43 @@ def load_api_credentials() -> tuple:
     return api_key, api_secret
 
 
-def main():
-    """Main CLI entry point"""
+def load_orders_file(path: str) -> List[dict]:
+    """
+    Load orders from a JSON file
+    
+    The file must contain a list of objects with symbol, side, type,
+    quantity and (for LIMIT orders) price keys.
+    
+    Args:
+        path: Path to the JSON file
+        
+    Returns:
+        List of raw order dictionaries
+        
+    Raises:
+        ValueError: If the file cannot be read or has the wrong shape
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            orders = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        raise ValueError(f"Could not read orders file {path}: {e}")
+    
+    if not isinstance(orders, list) or not orders:
+        raise ValueError("Orders file must contain a non-empty JSON list")
+    
+    for i, order in enumerate(orders, 1):
+        if not isinstance(order, dict):
+            raise ValueError(f"Order {i} in orders file must be a JSON object")
+        missing = [key for key in ('symbol', 'side', 'type', 'quantity') if key not in order]
+        if missing:
+            raise ValueError(f"Order {i} in orders file is missing: {', '.join(missing)}")
+    
+    return orders
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser"""
     parser = argparse.ArgumentParser(
         description='Binance Futures Trading Bot - Place orders on Testnet',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -76,30 +115,30 @@ Examples:
 
   # Place orders with custom log directory
   python cli.py --symbol BTCUSDT --side BUY --type MARKET --quantity 0.001 --log-dir ./my_logs
+
+  # Place several orders from a JSON file in batched requests
+  python cli.py --orders-file orders.json
         """
     )
     
-    # Required arguments
+    # Order arguments (required unless --orders-file is given)
     parser.add_argument(
         '--symbol',
         type=str,
-        required=True,
         help='Trading pair symbol (e.g., BTCUSDT, ETHUSDT)'
     )
     
     parser.add_argument(
         '--side',
-        type=str,
-        required=True,
-        choices=['BUY', 'SELL', 'buy', 'sell'],
+        type=str.upper,
+        choices=['BUY', 'SELL'],
         help='Order side: BUY or SELL'
     )
     
     parser.add_argument(
         '--type',
-        type=str,
-        required=True,
-        choices=['MARKET', 'LIMIT', 'market', 'limit'],
+        type=str.upper,
+        choices=['MARKET', 'LIMIT'],
         help='Order type: MARKET or LIMIT',
         dest='order_type'
     )
@@ -107,11 +146,16 @@ Examples:
     parser.add_argument(
         '--quantity',
         type=float,
-        required=True,
         help='Order quantity (must be greater than 0)'
     )
     
     # Optional arguments
+    parser.add_argument(
+        '--orders-file',
+        type=str,
+        help='JSON file with a list of orders to place in batched requests'
+    )
+    
     parser.add_argument(
         '--price',
         type=float,
@@ -131,8 +175,34 @@ Examples:
         help='Enable verbose logging (DEBUG level)'
     )
     
+    return parser
+
+
+# Parser built once per process and reused across main() calls
+_PARSER = None
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Return the cached argument parser, building it on first use"""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER
+
+
+def main():
+    """Main CLI entry point"""
+    parser = _get_parser()
     args = parser.parse_args()
     
+    order_args = (args.symbol, args.side, args.order_type, args.quantity, args.price)
+    if args.orders_file and any(arg is not None for arg in order_args):
+        parser.error("--orders-file cannot be combined with --symbol, --side, "
+                     "--type, --quantity or --price")
+    if not args.orders_file and None in order_args[:4]:
+        parser.error("--symbol, --side, --type and --quantity are required "
+                     "unless --orders-file is given")
+    
     # Print banner
     print_banner()
     
@@ -145,28 +215,51 @@ Examples:
         logger.info("Loading API credentials from environment variables")
         api_key, api_secret = load_api_credentials()
         
+        # Collect orders
+        if args.orders_file:
+            logger.info(f"Loading orders from {args.orders_file}")
+            raw_orders = load_orders_file(args.orders_file)
+        else:
+            raw_orders = [{
+                'symbol': args.symbol,
+                'side': args.side,
+                'type': args.order_type,
+                'quantity': args.quantity,
+                'price': args.price
+            }]
+        
         # Validate inputs
         logger.info("Validating input parameters")
-        validated = InputValidator.validate_all(
-            symbol=args.symbol,
-            side=args.side,
-            order_type=args.order_type,
-            quantity=args.quantity,
-            price=args.price
-        )
+        orders = []
+        for i, order in enumerate(raw_orders, 1):
+            try:
+                orders.append(InputValidator.validate_all(
+                    symbol=order['symbol'],
+                    side=order['side'],
+                    order_type=order['type'],
+                    quantity=order['quantity'],
+                    price=order.get('price')
+                ))
+            except ValueError as e:
+                if not args.orders_file:
+                    raise
+                raise ValueError(f"Order {i} in orders file: {e}")
         
         # Print order summary
-        print_order_summary(
-            validated['symbol'],
-            validated['side'],
-            validated['order_type'],
-            validated['quantity'],
-            validated['price']
-        )
+        for validated in orders:
+            print_order_summary(
+                validated['symbol'],
+                validated['side'],
+                validated['order_type'],
+                validated['quantity'],
+                validated['price']
+            )
         
-        # Initialize client
+        # Initialize client (imported here to keep --help and validation errors fast)
         logger.info("Initializing Binance Futures client")
-        client = BinanceFuturesClient(api_key, api_secret)
+        from bot import BinanceFuturesClient, OrderManager
+        client = BinanceFuturesClient(api_key, api_secret,
+                                      cache_dir=os.path.join(args.log_dir, '.cache'))
         
         # Test connectivity
         logger.info("Testing API connectivity")
@@ -178,7 +271,33 @@ Examples:
         # Initialize order manager
         order_manager = OrderManager(client)
         
+        # Several orders go through the batch endpoint
+        if len(orders) > 1:
+            print(f"\nPlacing {len(orders)} orders in batches...")
+            responses = order_manager.place_batch_orders(orders)
+            
+            placed = 0
+            unknown = 0
+            for i, response in enumerate(responses, 1):
+                if 'orderId' in response:
+                    placed += 1
+                    print(order_manager.format_order_response(response))
+                elif response.get('status') == 'UNKNOWN':
+                    unknown += 1
+                    print(f"\n? Order {i} status unknown - check open orders before "
+                          f"resubmitting: {response.get('msg', 'Unknown error')}")
+                else:
+                    print(f"\n✗ Order {i} not placed: {response.get('msg', 'Unknown error')}")
+            
+            print(f"\n✓ {placed}/{len(orders)} orders placed successfully")
+            if unknown:
+                print(f"? {unknown} orders have unknown status - check open orders")
+            print(f"\nLog file: {log_file}")
+            
+            return 0 if placed == len(orders) else 1
+        
         # Place order
+        validated = orders[0]
         print(f"\nPlacing {validated['order_type']} order...")
         
         if validated['order_type'] == 'MARKET':